@@ -8,17 +8,157 @@ RSS 文章抓取並轉換為 Markdown
 5. 轉換為 Markdown 並儲存到以系列標題命名的目錄
 """
 
+import argparse
 import asyncio
+import hashlib
+import io
 import json
+import math
+import os
+import random
 import re
-import uuid
+import shutil
 import xml.etree.ElementTree as ET
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from urllib.parse import urlparse
 
 import httpx
-from markdownify import markdownify as md
-from playwright.async_api import async_playwright, Playwright
+from bs4 import BeautifulSoup, Tag
+from markdownify import ATX, MarkdownConverter
+from playwright.async_api import async_playwright, Browser, Page, Route
+
+try:
+    # uvloop 為選用相依套件（不支援 Windows），有安裝時改用其較快的 event loop
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# 同時開啟的文章頁面數量上限（過高容易造成逾時或被限流）
+MAX_PARALLEL_PAGES = 5
+
+# 同時處理的系列數量上限（每個系列各自最多開啟 MAX_PARALLEL_PAGES 個頁面）
+SERIES_CONCURRENCY = 3
+
+# 文章頁面導覽逾時（毫秒）；內容由伺服器端產生，不需要等待過久
+PAGE_TIMEOUT_MS = 15000
+
+# 啟動 Chromium 時停用用不到的功能，降低啟動時間與每個頁面的負擔
+BROWSER_ARGS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+]
+
+# 頁面只用來取得 HTML，使用較小的視窗減少排版與繪製的工作量
+VIEWPORT = {"width": 800, "height": 600}
+
+# 抓取文章時不需要載入的資源類型
+BLOCKED_RESOURCE_TYPES = {"image", "stylesheet", "font", "media"}
+
+# 抓取文章時不需要載入的追蹤/廣告主機（包含其子網域）
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "facebook.net",
+    "facebook.com",
+    "scorecardresearch.com",
+    "hotjar.com",
+)
+
+# iThome 文章主要內容的選擇器（依優先順序）
+CONTENT_SELECTORS = [
+    "div.markdown-body",
+    "div.qa-markdown",
+    "article.article-content",
+    "div.article-content",
+]
+
+# 系列頁面 RSS 連結的選擇器（依優先順序）
+RSS_LINK_SELECTORS = [
+    "a.btn-rss.btn-no-border",
+    'a[href*="/rss/series/"]',
+]
+
+# 系列頁面標題的選擇器（依優先順序）
+TITLE_SELECTORS = [
+    "h3.qa-list__title",
+    "h2.ir-profile-content__title",
+    ".profile-header__name",
+    "h1",
+]
+
+# 在瀏覽器中依序嘗試選擇器，一次往返取得第一個符合元素的 innerHTML
+FIRST_MATCH_HTML_JS = """(selectors) => {
+    for (const selector of selectors) {
+        const element = document.querySelector(selector);
+        if (element) return element.innerHTML;
+    }
+    return "";
+}"""
+# 一次往返取得系列頁面的 RSS 連結 href 與標題 innerText
+SERIES_INFO_JS = """([rssSelectors, titleSelectors]) => {
+    const first = (selectors) => {
+        for (const selector of selectors) {
+            const element = document.querySelector(selector);
+            if (element) return element;
+        }
+        return null;
+    };
+    const rss = first(rssSelectors);
+    const title = first(titleSelectors);
+    return {
+        rss_href: rss ? rss.getAttribute("href") : null,
+        series_title: title ? title.innerText : null,
+    };
+}"""
+
+# 共用的 HTML 轉 Markdown 轉換器（每個 process 建立一次，沿用其轉換函式快取）
+MARKDOWN_CONVERTER = MarkdownConverter(heading_style=ATX, strip=["button"])
+
+# 每個背景 thread 一次寫入的檔案數量
+WRITE_BATCH_SIZE = 8
+
+# 直接以 os.open 建立/覆寫檔案的旗標（Windows 需要 O_BINARY 避免換行轉換）
+WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# 將檔名中不合法的字元 (Windows/Unix) 替換為底線的轉換表
+SANITIZE_TABLE = str.maketrans(
+    {c: "_" for c in '<>:"/\\|?*' + "".join(chr(i) for i in range(32))})
+# 連續的底線
+UNDERSCORE_RUN_RE = re.compile(r"_+")
+# RSS 標題中的鐵人賽後綴，例如「 :: 2025 iThome 鐵人賽」
+ITHOME_SUFFIX_RE = re.compile(r"\s*::\s*\d+\s*iThome\s*鐵人賽.*$")
+# 系列頁面標題的「系列」後綴
+SERIES_SUFFIX_RE = re.compile(r"\s*系列\s*$")
+# Markdown 圖片語法: ![alt text](url)
+IMAGE_MD_RE = re.compile(r"!\[([^\]]*)\]\(([^)]+)\)")
+
+# HTTP 請求遇到暫時性錯誤 (429 / 5xx / 連線錯誤) 時的最大嘗試次數
+MAX_RETRIES = 5
+
+# 依照 Retry-After 標頭等待的秒數上限
+MAX_RETRY_AFTER = 60.0
+
+# 每個主機同時進行的 HTTP 請求數量上限
+MAX_REQUESTS_PER_HOST = 32
+
+# 跨系列共用的圖片池（以內容雜湊命名），放在發布的 articles 目錄之外
+IMAGE_POOL_DIR = Path(__file__).parent / ".image_pool"
+
+# 主機名稱 -> 限制同時請求數量的 Semaphore
+HOST_SEMAPHORES: dict[str, asyncio.Semaphore] = {}
+
+# HTTP 請求共用的標頭
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Referer": "https://ithelp.ithome.com.tw/",
+}
 
 
 def sanitize_filename(title: str) -> str:
@@ -27,18 +167,114 @@ def sanitize_filename(title: str) -> str:
     移除或替換不合法的字元
     """
     # 移除或替換 Windows/Unix 不合法的檔名字元
-    invalid_chars = r'[<>:"/\\|?*\x00-\x1f]'
-    filename = re.sub(invalid_chars, "_", title)
+    filename = title.translate(SANITIZE_TABLE)
     # 移除首尾空白和點號
     filename = filename.strip().strip(".")
-    # 替換連續的底線為單一底線
-    filename = re.sub(r"_+", "_", filename)
+    # 替換連續的底線為單一底線（大多數標題沒有連續底線，不必進入 regex）
+    if "__" in filename:
+        filename = UNDERSCORE_RUN_RE.sub("_", filename)
     # 限制檔名長度（避免過長）
     if len(filename) > 200:
         filename = filename[:200]
     return filename
 
 
+def create_http_client() -> httpx.AsyncClient:
+    """
+    建立共用的 httpx.AsyncClient
+
+    所有 RSS 與圖片請求共用同一個連線池，
+    透過 keep-alive 重複使用連線，減少 TCP/TLS 連線建立的成本
+
+    Returns:
+        httpx.AsyncClient 實例
+    """
+    return httpx.AsyncClient(
+        timeout=30.0,
+        follow_redirects=True,
+        verify=False,
+        headers=HEADERS,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    )
+
+
+def get_retry_after(response: httpx.Response) -> float | None:
+    """
+    從回應的 Retry-After 標頭取得需要等待的秒數
+
+    Args:
+        response: HTTP 回應
+
+    Returns:
+        等待秒數，沒有標頭或格式不正確時返回 None
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+
+    # Retry-After 可能是秒數或 HTTP 日期
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError, OverflowError):
+            return None
+        # 時區為 -0000 的日期會被解析成不含時區的 datetime，視為 UTC
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+
+    if math.isnan(delay):
+        return None
+
+    return min(max(delay, 0.0), MAX_RETRY_AFTER)
+
+
+async def get_with_retry(
+    client: httpx.AsyncClient, url: str, headers: dict[str, str] | None = None
+) -> httpx.Response:
+    """
+    發送 GET 請求，遇到 429 / 5xx 或連線錯誤時以指數退避重試
+
+    每個主機同時進行的請求數量受 MAX_REQUESTS_PER_HOST 限制，
+    伺服器有回傳 Retry-After 時優先依照其指示等待
+
+    Args:
+        client: 共用的 httpx.AsyncClient
+        url: 請求 URL
+        headers: 額外的請求標頭
+
+    Returns:
+        最後一次請求的回應
+
+    Raises:
+        httpx.TransportError: 最後一次嘗試仍發生連線錯誤時
+    """
+    host = urlparse(url).netloc
+    semaphore = HOST_SEMAPHORES.setdefault(host, asyncio.Semaphore(MAX_REQUESTS_PER_HOST))
+
+    attempt = 0
+    while True:
+        attempt += 1
+        delay = None
+        try:
+            async with semaphore:
+                response = await client.get(url, headers=headers)
+        except httpx.TransportError:
+            if attempt >= MAX_RETRIES:
+                raise
+        else:
+            retryable = response.status_code == 429 or response.status_code >= 500
+            if not retryable or attempt >= MAX_RETRIES:
+                return response
+            delay = get_retry_after(response)
+
+        if delay is None:
+            delay = 2 ** (attempt - 1) + random.random()
+        await asyncio.sleep(delay)
+
+
 def load_rss_json(json_path: Path) -> list[str]:
     """
     從 rss.json 讀取系列頁面 URL 列表
@@ -58,20 +294,293 @@ def load_rss_json(json_path: Path) -> list[str]:
         return []
 
 
-async def fetch_series_info_async(playwright: Playwright, series_url: str) -> dict | None:
+def load_http_cache(cache_path: Path) -> dict[str, dict]:
+    """
+    讀取記錄 ETag / Last-Modified 的 HTTP 快取檔
+
+    Args:
+        cache_path: 快取檔路徑
+
+    Returns:
+        URL -> {"etag", "last_modified"} 映射，檔案不存在或讀取失敗時返回空字典
+    """
+    if not cache_path.exists():
+        return {}
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"警告: 讀取 {cache_path} 失敗，忽略快取 - {e}")
+        return {}
+
+
+def save_http_cache(cache_path: Path, http_cache: dict[str, dict]) -> None:
+    """
+    寫入記錄 ETag / Last-Modified 的 HTTP 快取檔
+
+    Args:
+        cache_path: 快取檔路徑
+        http_cache: URL -> {"etag", "last_modified"} 映射
+    """
+    try:
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump(http_cache, f, ensure_ascii=False, indent=2)
+    except Exception as e:
+        print(f"警告: 寫入 {cache_path} 失敗 - {e}")
+
+
+def build_conditional_headers(validators: dict | None) -> dict[str, str]:
+    """
+    依照上次回應的 ETag / Last-Modified 建立條件式請求標頭
+
+    Args:
+        validators: 上次回應的 {"etag", "last_modified"}，沒有記錄時為 None
+
+    Returns:
+        If-None-Match / If-Modified-Since 請求標頭
+    """
+    headers = {}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def build_series_info(rss_href: str, series_title: str | None) -> dict:
+    """
+    整理系列頁面取得的 RSS 連結與標題
+
+    Args:
+        rss_href: RSS 連結（可能是相對路徑）
+        series_title: 系列標題，找不到時為 None
+
+    Returns:
+        包含 rss_url 和 series_title 的字典
+    """
+    rss_url = rss_href
+    if rss_url and not rss_url.startswith("http"):
+        rss_url = "https://ithelp.ithome.com.tw" + rss_url
+
+    if series_title:
+        # 清理標題（移除「系列」後綴等）
+        series_title = SERIES_SUFFIX_RE.sub("", series_title.strip())
+
+    if not series_title:
+        series_title = "Unknown Series"
+
+    return {"rss_url": rss_url, "series_title": series_title}
+
+
+def get_inner_text(element: Tag) -> str:
+    """
+    以接近瀏覽器 innerText 的方式取得元素文字
+
+    HTML 原始碼中的換行與縮排合併為單一空白，<br> 視為換行，
+    與 Playwright 路徑取得的標題一致（避免同一系列產生不同的目錄名稱）
+
+    Args:
+        element: BeautifulSoup 解析出的元素
+
+    Returns:
+        元素的文字內容
+    """
+    for br in element.find_all("br"):
+        br.replace_with("\x00")
+    parts = element.get_text(" ").split("\x00")
+    return "\n".join(" ".join(part.split()) for part in parts)
+
+
+def extract_series_info(page_html: str) -> dict | None:
+    """
+    從系列頁面的 HTML 中取出 RSS URL 和系列標題
+
+    Args:
+        page_html: 完整的網頁 HTML
+
+    Returns:
+        包含 rss_url 和 series_title 的字典，找不到 RSS 連結時返回 None
+    """
+    soup = BeautifulSoup(page_html, "html.parser")
+
+    rss_href = ""
+    for selector in RSS_LINK_SELECTORS:
+        element = soup.select_one(selector)
+        if element is not None:
+            rss_href = element.get("href") or ""
+            break
+    if not rss_href:
+        return None
+
+    series_title = None
+    for selector in TITLE_SELECTORS:
+        element = soup.select_one(selector)
+        if element is not None:
+            series_title = get_inner_text(element)
+            break
+
+    return build_series_info(rss_href, series_title)
+
+
+async def fetch_series_info_via_http_async(client: httpx.AsyncClient, series_url: str) -> dict | None:
+    """
+    使用 httpx 直接抓取系列頁面，取得 RSS URL 和系列標題
+
+    Args:
+        client: 共用的 httpx.AsyncClient
+        series_url: 系列頁面 URL
+
+    Returns:
+        包含 rss_url 和 series_title 的字典，失敗時返回 None
+    """
+    try:
+        response = await get_with_retry(client, series_url)
+        if response.status_code != 200:
+            return None
+        return extract_series_info(response.text)
+    except Exception as e:
+        print(f"  警告: 直接抓取 {series_url} 失敗，改用瀏覽器 - {e}")
+        return None
+
+
+def new_browser_state() -> dict:
+    """
+    建立延遲啟動瀏覽器用的狀態
+
+    Returns:
+        尚未啟動 Playwright 與瀏覽器的狀態字典
+    """
+    return {"playwright": None, "browser": None, "error": None, "lock": asyncio.Lock()}
+
+
+async def get_browser_async(browser_state: dict) -> Browser:
+    """
+    取得共用的瀏覽器，第一次需要時才啟動 Playwright 與 Chromium
+
+    只有 httpx 取不到內容時才會用到瀏覽器，大多數執行都不需要啟動
+
+    Args:
+        browser_state: new_browser_state() 建立的狀態
+
+    Returns:
+        共用的瀏覽器實例
+
+    Raises:
+        Exception: 啟動失敗時（例如尚未執行 playwright install chromium），
+            之後的呼叫都會拋出同一個例外，不再重複嘗試
+    """
+    async with browser_state["lock"]:
+        if browser_state["error"] is not None:
+            raise browser_state["error"]
+
+        if browser_state["browser"] is None:
+            try:
+                print("啟動瀏覽器...")
+                if browser_state["playwright"] is None:
+                    browser_state["playwright"] = await async_playwright().start()
+                browser_state["browser"] = await browser_state["playwright"].chromium.launch(
+                    headless=True, args=BROWSER_ARGS)
+            except Exception as e:
+                browser_state["error"] = e
+                raise
+
+        return browser_state["browser"]
+
+
+async def close_browser_async(browser_state: dict) -> None:
+    """
+    關閉已啟動的瀏覽器與 Playwright
+
+    Args:
+        browser_state: new_browser_state() 建立的狀態
+    """
+    if browser_state["browser"] is not None:
+        await browser_state["browser"].close()
+    if browser_state["playwright"] is not None:
+        await browser_state["playwright"].stop()
+
+
+def new_page_state() -> dict:
+    """
+    建立系列專用的頁面狀態（context 在第一次需要頁面時才建立）
+
+    Returns:
+        包含 context、閒置頁面佇列與建立 context 用的 Lock 的狀態字典
+    """
+    return {"context": None, "idle_pages": asyncio.Queue(), "lock": asyncio.Lock()}
+
+
+async def acquire_page_async(browser_state: dict, page_state: dict) -> Page:
+    """
+    取得可用的頁面，優先重複使用閒置的頁面，沒有閒置頁面時才開新頁面
+
+    Args:
+        browser_state: new_browser_state() 建立的狀態
+        page_state: new_page_state() 建立的系列頁面狀態
+
+    Returns:
+        可用的頁面，用完後以 release_page() 放回
+    """
+    try:
+        return page_state["idle_pages"].get_nowait()
+    except asyncio.QueueEmpty:
+        pass
+
+    async with page_state["lock"]:
+        if page_state["context"] is None:
+            browser = await get_browser_async(browser_state)
+            context = await browser.new_context(viewport=VIEWPORT)
+            context.set_default_navigation_timeout(PAGE_TIMEOUT_MS)
+            await context.route("**/*", block_unneeded_resources)
+            page_state["context"] = context
+
+    return await page_state["context"].new_page()
+
+
+def release_page(page_state: dict, page: Page) -> None:
+    """
+    將用完的頁面放回閒置佇列
+
+    Args:
+        page_state: new_page_state() 建立的系列頁面狀態
+        page: 用完的頁面
+    """
+    if not page.is_closed():
+        page_state["idle_pages"].put_nowait(page)
+
+
+async def close_page_state_async(page_state: dict) -> None:
+    """
+    關閉系列的 context（連同其中所有頁面）
+
+    Args:
+        page_state: new_page_state() 建立的系列頁面狀態
+    """
+    if page_state["context"] is not None:
+        await page_state["context"].close()
+
+
+async def fetch_series_info_via_browser_async(browser_state: dict, series_url: str) -> dict | None:
     """
     使用 Playwright 爬取系列頁面，取得 RSS URL 和系列標題
 
     Args:
-        playwright: Playwright 實例
+        browser_state: 延遲啟動的共用瀏覽器狀態
         series_url: 系列頁面 URL
 
     Returns:
         包含 rss_url 和 series_title 的字典，失敗時返回 None
     """
-    browser = await playwright.webkit.launch(headless=True)
     try:
-        context = await browser.new_context()
+        browser = await get_browser_async(browser_state)
+    except Exception as e:
+        print(f"  錯誤: 無法啟動瀏覽器爬取 {series_url} - {e}")
+        return None
+
+    context = await browser.new_context(viewport=VIEWPORT)
+    try:
+        await context.route("**/*", block_unneeded_resources)
         page = await context.new_page()
 
         response = await page.goto(series_url, wait_until="domcontentloaded")
@@ -79,169 +588,219 @@ async def fetch_series_info_async(playwright: Playwright, series_url: str) -> di
             print(f"  警告: 無法載入頁面 {series_url}")
             return None
 
-        # 取得 RSS 連結 (class="btn-rss btn-no-border")
-        rss_btn = page.locator("a.btn-rss.btn-no-border").first
-        if await rss_btn.count() == 0:
-            # 嘗試其他選擇器
-            rss_btn = page.locator('a[href*="/rss/series/"]').first
-
-        if await rss_btn.count() == 0:
+        # 一次取得 RSS 連結 (class="btn-rss btn-no-border") 和系列標題
+        info = await page.evaluate(SERIES_INFO_JS, [RSS_LINK_SELECTORS, TITLE_SELECTORS])
+        if info["rss_href"] is None:
             print(f"  警告: 在 {series_url} 中找不到 RSS 連結")
             return None
 
-        rss_url = await rss_btn.get_attribute("href") or ""
-        if rss_url and not rss_url.startswith("http"):
-            rss_url = "https://ithelp.ithome.com.tw" + rss_url
-
-        # 取得系列標題
-        title_selectors = [
-            "h3.qa-list__title",
-            "h2.ir-profile-content__title",
-            ".profile-header__name",
-            "h1",
-        ]
-
-        series_title = None
-        for selector in title_selectors:
-            title_elem = page.locator(selector).first
-            if await title_elem.count() > 0:
-                series_title = await title_elem.inner_text()
-                # 清理標題（移除「系列」後綴等）
-                series_title = re.sub(r"\s*系列\s*$", "", series_title)
-                break
-
-        if not series_title:
-            series_title = "Unknown Series"
-
-        return {"rss_url": rss_url, "series_title": series_title}
+        return build_series_info(info["rss_href"], info["series_title"])
 
     except Exception as e:
         print(f"  錯誤: 爬取 {series_url} 失敗 - {e}")
         return None
     finally:
-        await browser.close()
+        await context.close()
 
 
-async def fetch_rss_content_async(playwright: Playwright, rss_url: str) -> tuple[str, list[dict]]:
+async def fetch_series_info_async(
+    client: httpx.AsyncClient, browser_state: dict, series_url: str
+) -> dict | None:
     """
-    使用 Playwright 從 RSS URL 取得文章列表
+    取得系列的 RSS URL 和系列標題
+
+    先以 httpx 直接抓取，找不到 RSS 連結時才改用 Playwright
 
     Args:
-        playwright: Playwright 實例
-        rss_url: RSS URL
+        client: 共用的 httpx.AsyncClient
+        browser_state: 延遲啟動的共用瀏覽器狀態
+        series_url: 系列頁面 URL
+
+    Returns:
+        包含 rss_url 和 series_title 的字典，失敗時返回 None
+    """
+    series_info = await fetch_series_info_via_http_async(client, series_url)
+    if series_info:
+        return series_info
+    return await fetch_series_info_via_browser_async(browser_state, series_url)
+
+
+def parse_rss_xml(xml_content: bytes) -> tuple[str, list[dict]]:
+    """
+    解析 RSS XML，取得系列標題與文章列表
+
+    以串流方式解析，每處理完一個 item 就將其從 channel 移除以節省記憶體。
+    此函式不依賴任何外部狀態，回傳值也可以被 pickle，
+    因此可以直接交給 ProcessPoolExecutor 執行。
+
+    Args:
+        xml_content: RSS XML 的原始位元組
 
     Returns:
-        (系列標題, 文章列表) 元組
+        (系列標題, 文章列表) 元組，解析失敗時返回空標題與空列表
     """
     articles = []
     series_title = ""
 
-    browser = await playwright.webkit.launch(headless=True)
+    channel = None
     try:
-        context = await browser.new_context()
-        page = await context.new_page()
+        for event, elem in ET.iterparse(io.BytesIO(xml_content), events=("start", "end")):
+            if event == "start":
+                # 記住 channel，之後才能把處理完的 item 從樹中移除
+                if elem.tag == "channel":
+                    channel = elem
+                continue
 
-        # 使用 request 上下文來獲取原始響應
-        api_context = context.request
-        response = await api_context.get(rss_url)
+            if elem.tag == "item":
+                # 空的 <title></title> 也視為沒有標題，避免產生名為 .md 的檔案
+                title = elem.findtext("title") or "Untitled"
+                # 清理連結（移除 RSS 追蹤參數）
+                link = elem.findtext("link", "").partition("?")[0]
+
+                articles.append({"title": title, "link": link})
+                elem.clear()
+                # iterparse 會一次讀入一段資料，此時後面的 item 可能已經接在 channel 上，
+                # 因此不能假設 elem 是最後一個子元素；之前處理完的 item 都已移除，
+                # 從頭找只需要經過 channel 的標題等少數子元素
+                if channel is not None:
+                    for index, child in enumerate(channel):
+                        if child is elem:
+                            del channel[index]
+                            break
+    except ET.ParseError as e:
+        print(f"  錯誤: 解析 RSS 失敗 - {e}")
+        return "", []
+
+    if channel is None:
+        print(f"  警告: RSS 中找不到 channel 元素")
+        return "", []
+
+    # 取得系列標題
+    series_title = channel.findtext("title") or ""
+    if series_title:
+        # 清理標題
+        series_title = ITHOME_SUFFIX_RE.sub("", series_title)
 
-        if response.status != 200:
-            print(f"  警告: 無法載入 RSS {rss_url}, 狀態碼: {response.status}")
-            return series_title, articles
+    return series_title, articles
 
-        xml_content = await response.text()
 
-        # 解析 XML
-        try:
-            root = ET.fromstring(xml_content)
-        except ET.ParseError as e:
-            print(f"  錯誤: 解析 RSS 失敗 - {e}")
-            return series_title, articles
-
-        # 取得 channel 資訊
-        channel = root.find("channel")
-        if channel is None:
-            print(f"  警告: RSS 中找不到 channel 元素")
-            return series_title, articles
-
-        # 取得系列標題
-        title_elem = channel.find("title")
-        if title_elem is not None and title_elem.text:
-            series_title = title_elem.text
-            # 清理標題
-            series_title = re.sub(
-                r"\s*::\s*\d+\s*iThome\s*鐵人賽.*$", "", series_title)
-
-        # 遍歷所有 item
-        for item in channel.findall("item"):
-            item_title_elem = item.find("title")
-            link_elem = item.find("link")
-
-            title = item_title_elem.text if item_title_elem is not None else "Untitled"
-            link = link_elem.text if link_elem is not None else ""
-
-            # 清理連結（移除 RSS 追蹤參數）
-            if link:
-                link = link.split("?")[0]
-
-            articles.append({"title": title, "link": link})
+async def fetch_rss_content_async(
+    client: httpx.AsyncClient, rss_url: str, validators: dict | None = None
+) -> tuple[str, list[dict], dict] | None:
+    """
+    使用 httpx 從 RSS URL 取得文章列表
+
+    有上次回應的 ETag / Last-Modified 時發送條件式請求，RSS 未更新時不重新解析
+
+    Args:
+        client: 共用的 httpx.AsyncClient
+        rss_url: RSS URL
+        validators: 上次回應的 {"etag", "last_modified"}
 
+    Returns:
+        (系列標題, 文章列表, 本次回應的 {"etag", "last_modified"}) 元組，
+        RSS 未更新 (HTTP 304) 時返回 None
+    """
+    try:
+        # RSS 是靜態 XML，不需要瀏覽器
+        response = await get_with_retry(client, rss_url, build_conditional_headers(validators))
+
+        if response.status_code == 304:
+            return None
+
+        if response.status_code != 200:
+            print(f"  警告: 無法載入 RSS {rss_url}, 狀態碼: {response.status_code}")
+            return "", [], {}
+
+        # 直接交給 XML 解析器處理原始位元組，由 XML 宣告決定編碼
+        series_title, articles = parse_rss_xml(response.content)
         print(f"  從 RSS 解析出 {len(articles)} 篇文章")
+        new_validators = {
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+        }
+        return series_title, articles, new_validators
 
     except Exception as e:
         print(f"  錯誤: 處理 RSS 時發生未預期錯誤 - {e}")
-    finally:
-        await browser.close()
+        return "", [], {}
 
-    return series_title, articles
+
+async def block_unneeded_resources(route: Route) -> None:
+    """
+    中止不影響文章內容的資源請求（圖片、樣式、字型、影音、追蹤/廣告腳本）
+
+    Args:
+        route: Playwright 攔截到的請求
+    """
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+        return
+
+    host = urlparse(route.request.url).hostname or ""
+    if any(host == blocked or host.endswith("." + blocked) for blocked in BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def fetch_article_page_via_http_async(client: httpx.AsyncClient, url: str) -> str:
+    """
+    使用 httpx 直接抓取文章的完整網頁
+
+    iThome 文章內容由伺服器端產生，大多數情況下不需要瀏覽器
+
+    Args:
+        client: 共用的 httpx.AsyncClient
+        url: 文章 URL
+
+    Returns:
+        完整的網頁 HTML，失敗時返回空字串
+    """
+    try:
+        response = await get_with_retry(client, url)
+        if response.status_code != 200:
+            return ""
+        return response.text
+    except Exception as e:
+        print(f"      警告: 直接抓取 {url} 失敗，改用瀏覽器 - {e}")
+        return ""
 
 
-async def fetch_article_content_async(playwright: Playwright, url: str) -> str:
+async def fetch_article_content_via_browser_async(
+    browser_state: dict, page_state: dict, url: str
+) -> str:
     """
     使用 Playwright 抓取文章網頁的主要內容
 
+    優先重複使用系列中閒置的頁面，用完後放回閒置佇列
+
     Args:
-        playwright: Playwright 實例
+        browser_state: 延遲啟動的共用瀏覽器狀態
+        page_state: 系列專用的頁面狀態
         url: 文章 URL
 
     Returns:
         文章的 HTML 內容
     """
-    browser = await playwright.webkit.launch(headless=True)
     try:
-        context = await browser.new_context()
-        page = await context.new_page()
-
+        page = await acquire_page_async(browser_state, page_state)
+    except Exception as e:
+        print(f"      錯誤: 無法啟動瀏覽器抓取 {url} - {e}")
+        return ""
+    try:
         response = await page.goto(url, wait_until="domcontentloaded")
         if response is None or response.status != 200:
             print(f"      警告: 無法載入頁面 {url}")
             return ""
 
-        # iThome 文章主要內容的選擇器
-        content_selectors = [
-            "div.markdown-body",
-            "div.qa-markdown",
-            "article.article-content",
-            "div.article-content",
-        ]
-
-        html_content = ""
-        for selector in content_selectors:
-            try:
-                element = page.locator(selector).first
-                if await element.count() > 0:
-                    html_content = await element.inner_html()
-                    break
-            except Exception:
-                continue
-
-        return html_content
+        return await page.evaluate(FIRST_MATCH_HTML_JS, CONTENT_SELECTORS)
 
     except Exception as e:
         print(f"      錯誤: 抓取 {url} 時發生錯誤 - {e}")
         return ""
     finally:
-        await browser.close()
+        release_page(page_state, page)
 
 
 def convert_html_to_markdown(html_content: str) -> str:
@@ -254,60 +813,310 @@ def convert_html_to_markdown(html_content: str) -> str:
     Returns:
         Markdown 格式的字串
     """
-    if not html_content:
-        return ""
+    soup = BeautifulSoup(html_content, "html.parser")
+    return convert_element_to_markdown(soup)
 
-    # 使用 markdownify 轉換
-    markdown_content = md(
-        html_content,
-        heading_style="ATX",
-        strip=["script", "style", "button"],
-    )
+
+def convert_article_page_to_markdown(page_html: str) -> str | None:
+    """
+    從文章的完整網頁取出主要內容並轉換為 Markdown 格式
+
+    取出內容與轉換共用同一次解析，適合整個交給 process pool 執行
+
+    Args:
+        page_html: 完整的網頁 HTML
+
+    Returns:
+        Markdown 格式的字串，找不到符合 CONTENT_SELECTORS 的內容或內容轉換後為空
+        （例如由前端 JavaScript 產生內容的空容器）時返回 None
+    """
+    soup = BeautifulSoup(page_html, "html.parser")
+    for selector in CONTENT_SELECTORS:
+        element = soup.select_one(selector)
+        if element is not None:
+            break
+    else:
+        return None
+
+    if not element.contents:
+        return None
+
+    return convert_element_to_markdown(element) or None
+
+
+def convert_element_to_markdown(element: Tag) -> str:
+    """
+    將已解析的 HTML 元素轉換為 Markdown 格式
+
+    Args:
+        element: BeautifulSoup 解析出的文件或元素
+
+    Returns:
+        Markdown 格式的字串
+    """
+    # 先移除 script / style 節點，markdownify 就不必再走訪它們
+    for child in element(["script", "style"]):
+        child.decompose()
+
+    # 使用 markdownify 轉換已解析的文件，避免重複解析 HTML
+    markdown_content = MARKDOWN_CONVERTER.convert_soup(element)
     return markdown_content.strip()
 
 
-def save_article_as_markdown(
-    title: str, link: str, markdown_content: str, output_dir: Path
-) -> bool:
+def get_article_output_path(title: str, output_dir: Path) -> Path:
     """
-    將單篇文章儲存為 Markdown 檔案
+    取得文章 Markdown 檔案的輸出路徑
+
+    Args:
+        title: 文章標題
+        output_dir: 輸出目錄路徑
+
+    Returns:
+        以安全檔名組成的輸出路徑
+    """
+    return output_dir / (sanitize_filename(title) + ".md")
+
+
+def is_nonempty_file(path: Path) -> bool:
+    """
+    檢查檔案是否存在且內容不為空（只呼叫一次 stat）
+
+    Args:
+        path: 檔案路徑
+
+    Returns:
+        檔案存在且大小大於 0 時返回 True
+    """
+    try:
+        return os.stat(path).st_size > 0
+    except OSError:
+        return False
+
+
+def build_article_markdown(title: str, link: str, markdown_content: str) -> str:
+    """
+    建立完整的 Markdown 文件（包含標題和原始連結）
 
     Args:
         title: 文章標題
         link: 原始連結
         markdown_content: Markdown 格式的內容
-        output_dir: 輸出目錄路徑
 
     Returns:
-        是否成功儲存
+        完整的 Markdown 文件內容
     """
-    # 建立完整的 Markdown 文件（包含標題和原始連結）
-    full_content = f"# {title}\n\n"
+    parts = ["# ", title, "\n\n"]
     if link:
-        full_content += f"> 原文連結: {link}\n\n"
-    full_content += markdown_content
+        parts += ["> 原文連結: ", link, "\n\n"]
+    parts.append(markdown_content)
+    return "".join(parts)
+
+
+def write_files(files: list[tuple[Path, str]]) -> int:
+    """
+    依序寫入多個文字檔
+
+    內容只編碼一次後直接以 os.open / os.write 寫入，不經過 Python 的檔案物件與緩衝
+
+    Args:
+        files: (輸出檔案路徑, 檔案內容) 列表
+
+    Returns:
+        成功寫入的檔案數量
+    """
+    saved_count = 0
+    for output_path, content in files:
+        try:
+            data = memoryview(content.encode("utf-8"))
+            fd = os.open(output_path, WRITE_FLAGS, 0o666)
+            try:
+                # os.write 可能只寫入部分內容，寫完為止
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
+            saved_count += 1
+        except Exception as e:
+            print(f"錯誤: 儲存 {output_path.name} 失敗 - {e}")
+    return saved_count
+
+
+async def write_files_async(files: list[tuple[Path, str]]) -> int:
+    """
+    在背景 thread 中分批寫入多個文字檔，避免阻塞 event loop
+
+    每 WRITE_BATCH_SIZE 個檔案交給同一個 thread 寫入，減少 thread 切換的次數
+
+    Args:
+        files: (輸出檔案路徑, 檔案內容) 列表
 
-    # 產生安全的檔案名稱
-    filename = sanitize_filename(title) + ".md"
-    output_path = output_dir / filename
+    Returns:
+        成功寫入的檔案數量
+    """
+    results = await asyncio.gather(*(
+        asyncio.to_thread(write_files, files[i:i + WRITE_BATCH_SIZE])
+        for i in range(0, len(files), WRITE_BATCH_SIZE)
+    ))
+    return sum(results)
+
+
+async def localize_existing_article_async(
+    client: httpx.AsyncClient,
+    output_path: Path,
+    output_dir: Path,
+    pending_writes: list[tuple[Path, str]],
+    image_cache: dict[str, asyncio.Task],
+    image_stats: dict,
+    series_tag: str,
+) -> None:
+    """
+    重新處理已存在文章中仍是遠端連結的圖片，有變更時加入待寫入列表
 
+    Args:
+        client: 共用的 httpx.AsyncClient
+        output_path: 已存在的文章檔案路徑
+        output_dir: 系列目錄路徑
+        pending_writes: 系列結束時一次寫入的 (輸出檔案路徑, 檔案內容) 列表
+        image_cache: 跨系列共用的 圖片 URL -> 下載工作 映射
+        image_stats: 系列的圖片統計資訊
+        series_tag: 訊息前綴的系列標記（多個系列並行時區分輸出）
+    """
     try:
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(full_content)
-        return True
+        content = await asyncio.to_thread(output_path.read_text, encoding="utf-8")
     except Exception as e:
-        print(f"錯誤: 儲存 {filename} 失敗 - {e}")
+        print(f"      {series_tag} 讀取失敗: {output_path.name} - {e}")
+        return
+
+    # 沒有任何遠端連結時不必逐一比對圖片語法
+    if "](http" not in content:
+        return
+
+    image_stats["article_count"] += 1
+    new_content = await localize_images_async(
+        client, content, output_dir, image_cache, image_stats)
+    if new_content != content:
+        pending_writes.append((output_path, new_content))
+
+
+async def process_article_async(
+    client: httpx.AsyncClient,
+    browser_state: dict,
+    page_state: dict,
+    markdown_pool: Executor,
+    semaphore: asyncio.Semaphore,
+    article: dict,
+    index: int,
+    total: int,
+    output_dir: Path,
+    pending_writes: list[tuple[Path, str]],
+    image_cache: dict[str, asyncio.Task],
+    image_stats: dict,
+    series_tag: str,
+    force: bool = False,
+) -> bool:
+    """
+    處理單篇文章：抓取網頁內容、轉換、下載圖片，完成的文件加入待寫入列表
+
+    各階段以文章為單位串接，某篇文章下載圖片時其他文章仍可繼續抓取與轉換
+
+    Args:
+        client: 共用的 httpx.AsyncClient
+        browser_state: 延遲啟動的共用瀏覽器狀態
+        page_state: 系列專用的頁面狀態
+        markdown_pool: 執行 HTML 轉 Markdown 的 Executor
+        semaphore: 限制同時開啟頁面數量的 Semaphore
+        article: 包含 title 和 link 的文章字典
+        index: 文章序號（用於顯示進度）
+        total: 文章總數（用於顯示進度）
+        output_dir: 輸出目錄路徑
+        pending_writes: 系列結束時一次寫入的 (輸出檔案路徑, 檔案內容) 列表
+        image_cache: 跨系列共用的 圖片 URL -> 下載工作 映射
+        image_stats: 系列的圖片統計資訊
+        series_tag: 訊息前綴的系列標記（多個系列並行時區分輸出）
+        force: 是否重新抓取並覆寫已存在的文章
+
+    Returns:
+        文章是否已存在或已加入待寫入列表
+    """
+    title = article["title"]
+    link = article["link"]
+
+    if not link:
+        print(f"    {series_tag} 跳過 ({index}/{total}): {title[:50]}... 沒有連結")
         return False
 
+    # 已經儲存過的文章不再重新抓取（重新執行時只處理新文章），
+    # 但仍重試上次下載失敗、還是遠端連結的圖片
+    output_path = get_article_output_path(title, output_dir)
+    if not force and is_nonempty_file(output_path):
+        print(f"    {series_tag} 跳過 ({index}/{total}): {title[:50]}... 已存在")
+        await localize_existing_article_async(
+            client, output_path, output_dir, pending_writes, image_cache, image_stats, series_tag)
+        return True
+
+    loop = asyncio.get_running_loop()
+
+    # 先以 httpx 直接抓取完整網頁
+    async with semaphore:
+        print(f"    {series_tag} 處理中 ({index}/{total}): {title[:50]}...")
+        page_html = await fetch_article_page_via_http_async(client, link)
+
+    # 取出內容並轉換為 Markdown（CPU 密集，交給 process pool 以免阻塞 event loop）
+    markdown_content = None
+    if page_html:
+        markdown_content = await loop.run_in_executor(
+            markdown_pool, convert_article_page_to_markdown, page_html)
+
+    # 靜態 HTML 中找不到內容時才改用 Playwright
+    if markdown_content is None:
+        async with semaphore:
+            html_content = await fetch_article_content_via_browser_async(browser_state, page_state, link)
+
+        # 內容只有空白時直接略過，不必送到 process pool 轉換
+        if not html_content or html_content.isspace():
+            print(f"      {series_tag} 警告: 無法取得內容 ({index}/{total})")
+            return False
+
+        markdown_content = await loop.run_in_executor(
+            markdown_pool, convert_html_to_markdown, html_content)
 
-async def process_series_async(playwright: Playwright, series_url: str, base_output_dir: Path) -> int:
+    if not markdown_content:
+        print(f"      {series_tag} 警告: 轉換後內容為空 ({index}/{total})")
+        return False
+
+    # 下載文章中的圖片並替換為本地路徑
+    image_stats["article_count"] += 1
+    markdown_content = await localize_images_async(
+        client, markdown_content, output_dir, image_cache, image_stats)
+
+    # 加入待寫入列表，由系列結束時統一寫入
+    pending_writes.append(
+        (output_path, build_article_markdown(title, link, markdown_content)))
+    return True
+
+
+async def process_series_async(
+    browser_state: dict,
+    client: httpx.AsyncClient,
+    markdown_pool: Executor,
+    series_url: str,
+    base_output_dir: Path,
+    image_cache: dict[str, asyncio.Task],
+    http_cache: dict[str, dict],
+    force: bool = False,
+) -> int:
     """
     處理單一系列：取得 RSS、爬取文章、轉換並儲存
 
     Args:
-        playwright: Playwright 實例
+        browser_state: 延遲啟動的共用瀏覽器狀態
+        client: 共用的 httpx.AsyncClient
+        markdown_pool: 執行 HTML 轉 Markdown 的 Executor
         series_url: 系列頁面 URL
         base_output_dir: 基礎輸出目錄
+        image_cache: 跨系列共用的 圖片 URL -> 下載工作 映射
+        http_cache: RSS URL -> {"etag", "last_modified"} 映射，系列全部完成後才更新
+        force: 是否忽略 http_cache 並重新抓取、覆寫已存在的文章
 
     Returns:
         成功處理的文章數量
@@ -316,7 +1125,7 @@ async def process_series_async(playwright: Playwright, series_url: str, base_out
 
     # Step 1: 取得系列資訊（RSS URL 和系列標題）
     print("  [Step 1] 取得系列資訊...")
-    series_info = await fetch_series_info_async(playwright, series_url)
+    series_info = await fetch_series_info_async(client, browser_state, series_url)
     if not series_info:
         print("  無法取得系列資訊，跳過此系列")
         return 0
@@ -328,7 +1137,12 @@ async def process_series_async(playwright: Playwright, series_url: str, base_out
 
     # Step 2: 從 RSS 取得文章列表
     print("  [Step 2] 取得 RSS 文章列表...")
-    rss_series_title, articles = await fetch_rss_content_async(playwright, rss_url)
+    cached_validators = None if force else http_cache.get(rss_url)
+    rss_result = await fetch_rss_content_async(client, rss_url, cached_validators)
+    if rss_result is None:
+        print("  RSS 自上次完整抓取後沒有變更，跳過此系列")
+        return 0
+    rss_series_title, articles, validators = rss_result
 
     # 如果從系列頁面取得的標題不完整，使用 RSS 的標題
     if series_title == "Unknown Series" and rss_series_title:
@@ -344,74 +1158,150 @@ async def process_series_async(playwright: Playwright, series_url: str, base_out
     output_dir.mkdir(parents=True, exist_ok=True)
     print(f"  輸出目錄: {output_dir}")
 
-    # Step 3: 爬取並轉換文章
-    print(f"  [Step 3] 爬取並轉換 {len(articles)} 篇文章...")
-    success_count = 0
-
-    for i, article in enumerate(articles, 1):
-        title = article["title"]
-        link = article["link"]
-
-        print(f"    處理中 ({i}/{len(articles)}): {title[:50]}...")
+    # 最多 SERIES_CONCURRENCY 個系列同時執行，逐篇文章的訊息加上系列標記以免混在一起
+    series_tag = f"[{series_title[:20]}]"
 
-        if not link:
-            print(f"      跳過: 沒有連結")
-            continue
-
-        # 抓取網頁內容
-        html_content = await fetch_article_content_async(playwright, link)
-
-        if not html_content:
-            print(f"      警告: 無法取得內容")
-            continue
+    # Step 3: 爬取並轉換文章，同時下載文章中的圖片
+    # （需要瀏覽器時系列共用同一個 context，頁面用完後放回給下一篇文章使用）
+    print(f"  [Step 3] 爬取並轉換 {len(articles)} 篇文章...")
+    page_state = new_page_state()
+    try:
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_PAGES)
+        pending_writes: list[tuple[Path, str]] = []
+        image_stats = new_image_stats()
+        results = await asyncio.gather(*(
+            process_article_async(
+                client, browser_state, page_state, markdown_pool, semaphore, article, i, len(articles),
+                output_dir, pending_writes, image_cache, image_stats, series_tag, force)
+            for i, article in enumerate(articles, 1)
+        ), return_exceptions=True)
+    finally:
+        await close_page_state_async(page_state)
 
-        # 轉換為 Markdown
-        markdown_content = convert_html_to_markdown(html_content)
+    # 單篇文章的例外不影響其他文章，只計為失敗
+    for i, result in enumerate(results, 1):
+        if isinstance(result, Exception):
+            print(f"    {series_tag} 錯誤 ({i}/{len(articles)}): {articles[i - 1]['title'][:50]}... - {result}")
 
-        if not markdown_content:
-            print(f"      警告: 轉換後內容為空")
-            continue
+    # 一次並行寫入所有文章，寫入失敗的不計入成功數量
+    saved_count = await write_files_async(pending_writes)
+    success_count = sum(result is True for result in results) - (len(pending_writes) - saved_count)
 
-        # 儲存檔案
-        if save_article_as_markdown(title, link, markdown_content, output_dir):
-            success_count += 1
+    # 所有文章都已儲存且圖片都下載成功才記錄 RSS 的 ETag / Last-Modified，
+    # 否則下次執行會收到 304 而跳過此系列，失敗的文章與圖片就不會再重試
+    complete = success_count == len(articles) and image_stats["download_failed"] == 0
+    if complete and any(validators.values()):
+        http_cache[rss_url] = validators
 
-    # Step 4: 處理文章中的圖片
-    print(f"  [Step 4] 處理文章中的圖片...")
-    stats = await process_images_in_series(output_dir)
     print(
-        f"    圖片統計: 文章數={stats['article_count']}, 圖片數={stats['image_count']}, 成功={stats['download_success']}, 失敗={stats['download_failed']}")
+        f"    {series_tag} 圖片統計: 文章數={image_stats['article_count']}, 圖片數={image_stats['image_count']}, 成功={image_stats['download_success']}, 失敗={image_stats['download_failed']}")
 
     return success_count
 
 
-async def download_image_async(url: str, save_path: Path) -> bool:
+async def download_image_async(client: httpx.AsyncClient, url: str, pool_dir: Path) -> Path | None:
     """
-    下載圖片並儲存到指定路徑
+    下載圖片並儲存到共用的圖片池
+
+    圖片以內容雜湊命名，不同 URL 指向相同內容時只會保留一份
 
     Args:
+        client: 共用的 httpx.AsyncClient
         url: 圖片 URL
-        save_path: 儲存路徑
+        pool_dir: 圖片池目錄路徑
 
     Returns:
-        是否成功下載
+        圖片在圖片池中的路徑，失敗時返回 None
     """
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Referer": "https://ithelp.ithome.com.tw/",
-    }
     try:
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True, verify=False, headers=headers) as client:
-            response = await client.get(url)
-            if response.status_code == 200:
-                save_path.write_bytes(response.content)
-                return True
-            else:
-                print(f"      下載失敗 (狀態碼 {response.status_code}): {url}")
-                return False
+        response = await get_with_retry(client, url)
+        if response.status_code == 200:
+            return save_image_to_pool(response.content, get_image_extension(url), pool_dir)
+        else:
+            print(f"      下載失敗 (狀態碼 {response.status_code}): {url}")
+            return None
     except Exception as e:
         print(f"      下載錯誤: {url} - {e}")
-        return False
+        return None
+
+
+async def get_pooled_image_async(
+    client: httpx.AsyncClient,
+    url: str,
+    pool_dir: Path,
+    image_cache: dict[str, asyncio.Task],
+    stats: dict,
+) -> Path | None:
+    """
+    取得圖片在圖片池中的路徑，尚未下載過的圖片才會下載
+
+    同一 URL 同時被多篇文章引用時，後來的請求會等待同一個下載工作
+
+    Args:
+        client: 共用的 httpx.AsyncClient
+        url: 圖片 URL
+        pool_dir: 圖片池目錄路徑
+        image_cache: 跨系列共用的 圖片 URL -> 下載工作 映射
+        stats: 下載統計資訊（只統計實際下載的圖片）
+
+    Returns:
+        圖片在圖片池中的路徑，下載失敗時返回 None
+    """
+    task = image_cache.get(url)
+    if task is not None:
+        return await task
+
+    print(f"      下載中: {url[:60]}...")
+    task = asyncio.create_task(download_image_async(client, url, pool_dir))
+    image_cache[url] = task
+    pool_path = await task
+    if pool_path is not None:
+        stats["download_success"] += 1
+        print(f"      已儲存: {pool_path.name}")
+    else:
+        stats["download_failed"] += 1
+    return pool_path
+
+
+def save_image_to_pool(data: bytes, ext: str, pool_dir: Path) -> Path:
+    """
+    以內容雜湊作為檔名，將圖片儲存到圖片池
+
+    Args:
+        data: 圖片內容
+        ext: 副檔名 (包含點號)
+        pool_dir: 圖片池目錄路徑
+
+    Returns:
+        圖片在圖片池中的路徑
+    """
+    digest = hashlib.blake2b(data, digest_size=8).hexdigest()
+    pool_path = pool_dir / f"{digest}{ext}"
+    if not pool_path.exists():
+        pool_path.write_bytes(data)
+    return pool_path
+
+
+def link_image_to_media_dir(pool_path: Path, media_dir: Path) -> str:
+    """
+    將圖片池中的圖片放到系列的 media 目錄
+
+    優先使用硬連結避免重複佔用空間，不支援時改為複製
+
+    Args:
+        pool_path: 圖片在圖片池中的路徑
+        media_dir: 系列的 media 目錄路徑
+
+    Returns:
+        本地檔名
+    """
+    target = media_dir / pool_path.name
+    if not target.exists():
+        try:
+            os.link(pool_path, target)
+        except OSError:
+            shutil.copy2(pool_path, target)
+    return target.name
 
 
 def get_image_extension(url: str, default: str = ".png") -> str:
@@ -438,44 +1328,135 @@ def get_image_extension(url: str, default: str = ".png") -> str:
     return default
 
 
-async def process_images_in_series(series_dir: Path) -> dict:
+def replace_image_link(match: re.Match, url_to_local: dict[str, str]) -> str:
     """
-    處理單一系列目錄下所有 Markdown 文章中的圖片
+    將 Markdown 圖片語法中的 URL 替換為本地路徑（供 IMAGE_MD_RE.sub 使用）
 
-    1. 掃描系列目錄下的 .md 檔案
-    2. 找出所有圖片連結 (Markdown 格式: ![alt](url))
-    3. 下載圖片到系列目錄下的 media 子目錄
-    4. 將 Markdown 中的圖片路徑替換為本地路徑
+    Args:
+        match: IMAGE_MD_RE 的比對結果
+        url_to_local: 圖片 URL -> 本地檔名 的映射
+
+    Returns:
+        替換後的 Markdown 圖片語法，URL 未下載時保持原樣
+    """
+    alt_text, image_url = match.groups()
+    local_filename = url_to_local.get(image_url)
+    if local_filename is None:
+        return match.group(0)
+    return f"![{alt_text}](media/{local_filename})"
+
+
+async def localize_images_async(
+    client: httpx.AsyncClient,
+    content: str,
+    series_dir: Path,
+    image_cache: dict[str, asyncio.Task],
+    stats: dict,
+) -> str:
+    """
+    下載 Markdown 內容中的圖片，並將圖片路徑替換為本地路徑
+
+    圖片下載到共用的圖片池 (IMAGE_POOL_DIR)，再連結到系列目錄下的 media 子目錄
 
     Args:
+        client: 共用的 httpx.AsyncClient
+        content: Markdown 內容
         series_dir: 系列目錄路徑
+        image_cache: 跨系列共用的 圖片 URL -> 下載工作 映射
+        stats: 圖片統計資訊
 
     Returns:
-        處理統計資訊
+        替換圖片路徑後的 Markdown 內容
     """
-    stats = {
+    # 收集需要下載的圖片 URL（保持順序並去除重複）
+    image_urls: dict[str, None] = {}
+    for alt_text, image_url in IMAGE_MD_RE.findall(content):
+        stats["image_count"] += 1
+
+        # 跳過已經是本地路徑的圖片
+        if image_url.startswith("media/") or image_url.startswith("./media/"):
+            print(f"      跳過 (已是本地路徑): {image_url}")
+            continue
+
+        # 跳過非 HTTP(S) 的 URL
+        if not image_url.startswith("http://") and not image_url.startswith("https://"):
+            print(f"      跳過 (非 HTTP URL): {image_url}")
+            continue
+
+        image_urls[image_url] = None
+
+    if not image_urls:
+        return content
+
+    # 建立 media 目錄與共用的圖片池
+    media_dir = series_dir / "media"
+    media_dir.mkdir(exist_ok=True)
+    IMAGE_POOL_DIR.mkdir(exist_ok=True)
+
+    pool_paths = await asyncio.gather(*(
+        get_pooled_image_async(client, url, IMAGE_POOL_DIR, image_cache, stats)
+        for url in image_urls
+    ))
+
+    # 將圖片放到系列的 media 目錄，記錄 URL -> 本地檔名 的映射
+    url_to_local: dict[str, str] = {}
+    for image_url, pool_path in zip(image_urls, pool_paths):
+        if pool_path is not None:
+            url_to_local[image_url] = link_image_to_media_dir(pool_path, media_dir)
+
+    # 一次掃描替換 Markdown 中所有已下載圖片的路徑
+    return IMAGE_MD_RE.sub(lambda match: replace_image_link(match, url_to_local), content)
+
+
+def new_image_stats() -> dict:
+    """
+    建立圖片統計資訊
+
+    Returns:
+        各項數量皆為 0 的統計字典
+    """
+    return {
         "article_count": 0,
         "image_count": 0,
         "download_success": 0,
         "download_failed": 0,
     }
 
-    # Markdown 圖片語法的正則表達式: ![alt text](url)
-    image_pattern = re.compile(r"!\[([^\]]*)\]\(([^)]+)\)")
+
+async def process_images_in_series(
+    client: httpx.AsyncClient, series_dir: Path, image_cache: dict[str, asyncio.Task]
+) -> dict:
+    """
+    處理單一系列目錄下所有 Markdown 文章中的圖片
+
+    1. 掃描系列目錄下的 .md 檔案
+    2. 找出所有圖片連結 (Markdown 格式: ![alt](url))
+    3. 下載圖片到共用的圖片池 (IMAGE_POOL_DIR)，再連結到系列目錄下的 media 子目錄
+    4. 將 Markdown 中的圖片路徑替換為本地路徑
+
+    Args:
+        client: 共用的 httpx.AsyncClient
+        series_dir: 系列目錄路徑
+        image_cache: 跨系列共用的 圖片 URL -> 下載工作 映射
+
+    Returns:
+        處理統計資訊
+    """
+    stats = new_image_stats()
 
     if not series_dir.exists() or not series_dir.is_dir():
         print(f"錯誤: 目錄不存在或不是目錄 - {series_dir}")
         return stats
 
-    # 建立 media 目錄
-    media_dir = series_dir / "media"
-    media_dir.mkdir(exist_ok=True)
-
-    # 記錄已下載的圖片 URL -> 本地檔名 的映射（避免重複下載同一圖片）
-    url_to_local: dict[str, str] = {}
-
     # 遍歷系列目錄下的所有 .md 檔案
-    for md_file in series_dir.glob("*.md"):
+    with os.scandir(series_dir) as entries:
+        md_files = [
+            Path(entry.path) for entry in entries
+            if entry.name.endswith(".md") and entry.is_file()
+        ]
+
+    documents: list[tuple[Path, str]] = []
+    for md_file in md_files:
         stats["article_count"] += 1
         print(f"  處理文章: {md_file.name}")
 
@@ -485,76 +1466,38 @@ async def process_images_in_series(series_dir: Path) -> dict:
             print(f"    讀取失敗: {e}")
             continue
 
-        # 找出所有圖片
-        matches = image_pattern.findall(content)
-        if not matches:
-            print(f"    沒有找到圖片")
-            continue
-
-        print(f"    找到 {len(matches)} 張圖片")
-        new_content = content
-
-        for alt_text, image_url in matches:
-            stats["image_count"] += 1
+        documents.append((md_file, content))
 
-            # 跳過已經是本地路徑的圖片
-            if image_url.startswith("media/") or image_url.startswith("./media/"):
-                print(f"      跳過 (已是本地路徑): {image_url}")
-                continue
-
-            # 跳過非 HTTP(S) 的 URL
-            if not image_url.startswith("http://") and not image_url.startswith("https://"):
-                print(f"      跳過 (非 HTTP URL): {image_url}")
-                continue
-
-            # 檢查是否已下載過此 URL
-            if image_url in url_to_local:
-                local_filename = url_to_local[image_url]
-                print(f"      使用已下載: {local_filename}")
-            else:
-                # 生成 UUID 檔名
-                ext = get_image_extension(image_url)
-                local_filename = f"{uuid.uuid4()}{ext}"
-                save_path = media_dir / local_filename
-
-                # 下載圖片
-                print(f"      下載中: {image_url[:60]}...")
-                success = await download_image_async(image_url, save_path)
-
-                if success:
-                    stats["download_success"] += 1
-                    url_to_local[image_url] = local_filename
-                    print(f"      已儲存: {local_filename}")
-                else:
-                    stats["download_failed"] += 1
-                    continue
-
-            # 替換 Markdown 中的圖片路徑
-            old_image_md = f"![{alt_text}]({image_url})"
-            new_image_md = f"![{alt_text}](media/{local_filename})"
-            new_content = new_content.replace(old_image_md, new_image_md)
+    # 並行處理所有文章的圖片（同一 URL 只會下載一次）
+    new_contents = await asyncio.gather(*(
+        localize_images_async(client, content, series_dir, image_cache, stats)
+        for _, content in documents
+    ))
 
+    for (md_file, content), new_content in zip(documents, new_contents):
         # 寫回修改後的內容
         if new_content != content:
             try:
-                md_file.write_text(new_content, encoding="utf-8")
-                print(f"    已更新文章")
+                md_file.write_bytes(new_content.encode("utf-8"))
+                print(f"    已更新文章: {md_file.name}")
             except Exception as e:
                 print(f"    寫入失敗: {e}")
 
     return stats
 
 
-async def process_images_in_articles(articles_dir: Path) -> dict:
+async def process_images_in_articles(client: httpx.AsyncClient, articles_dir: Path) -> dict:
     """
     處理 articles 目錄下所有 Markdown 文章中的圖片
 
     1. 掃描所有系列目錄下的 .md 檔案
     2. 找出所有圖片連結 (Markdown 格式: ![alt](url))
-    3. 下載圖片到系列目錄下的 media 子目錄
+    3. 下載圖片到共用的圖片池，再連結到系列目錄下的 media 子目錄
+       （同一張圖片在多個系列中只下載一次）
     4. 將 Markdown 中的圖片路徑替換為本地路徑
 
     Args:
+        client: 共用的 httpx.AsyncClient
         articles_dir: articles 目錄路徑
 
     Returns:
@@ -572,20 +1515,23 @@ async def process_images_in_articles(articles_dir: Path) -> dict:
         print(f"錯誤: 目錄不存在 - {articles_dir}")
         return stats
 
-    # 遍歷所有系列目錄
-    for series_dir in articles_dir.iterdir():
-        if not series_dir.is_dir():
-            continue
+    # 跨系列共用的 圖片 URL -> 下載工作 映射
+    image_cache: dict[str, asyncio.Task] = {}
 
-        # 跳過 media 目錄本身
-        if series_dir.name == "media":
-            continue
+    # 遍歷所有系列目錄（跳過 media 目錄）
+    # scandir 的 DirEntry 會快取檔案類型，不需要對每個項目再做一次 stat
+    with os.scandir(articles_dir) as entries:
+        series_dirs = [
+            Path(entry.path) for entry in entries
+            if entry.name != "media" and entry.is_dir()
+        ]
 
+    for series_dir in series_dirs:
         stats["series_count"] += 1
         print(f"\n處理系列: {series_dir.name}")
 
         # 處理該系列的圖片
-        series_stats = await process_images_in_series(series_dir)
+        series_stats = await process_images_in_series(client, series_dir, image_cache)
 
         # 累加統計
         stats["article_count"] += series_stats["article_count"]
@@ -605,7 +1551,8 @@ async def process_images_main():
     print("處理 Markdown 文章中的圖片")
     print("=" * 60)
 
-    stats = await process_images_in_articles(articles_dir)
+    async with create_http_client() as client:
+        stats = await process_images_in_articles(client, articles_dir)
 
     print("\n" + "=" * 60)
     print("處理完成！統計資訊:")
@@ -617,12 +1564,18 @@ async def process_images_main():
     print("=" * 60)
 
 
-async def main():
-    """主程式入口"""
+async def main(force: bool = False):
+    """
+    主程式入口
+
+    Args:
+        force: 是否忽略 .http_cache.json 並重新抓取、覆寫已存在的文章
+    """
     # 設定路徑
     script_dir = Path(__file__).parent
     rss_json_path = script_dir / "rss.json"
     output_dir = script_dir / "articles"
+    http_cache_path = script_dir / ".http_cache.json"
 
     print("=" * 60)
     print("RSS 文章抓取並轉換為 Markdown")
@@ -641,11 +1594,36 @@ async def main():
     # Step 2: 處理每個系列
     print("\n[Phase 2] 處理各系列...")
     total_success = 0
+    image_cache: dict[str, asyncio.Task] = {}
+    http_cache = load_http_cache(http_cache_path)
 
-    async with async_playwright() as playwright:
-        for series_url in series_urls:
-            success_count = await process_series_async(playwright, series_url, output_dir)
-            total_success += success_count
+    with ProcessPoolExecutor() as markdown_pool:
+        async with create_http_client() as client:
+            # 整個執行過程共用同一個瀏覽器，第一次需要時才啟動
+            browser_state = new_browser_state()
+            try:
+                # 同時處理多個系列，各系列的 RSS 與文章抓取可以互相重疊
+                semaphore = asyncio.Semaphore(SERIES_CONCURRENCY)
+
+                async def bounded_process_series(series_url: str) -> int:
+                    async with semaphore:
+                        return await process_series_async(
+                            browser_state, client, markdown_pool, series_url, output_dir, image_cache,
+                            http_cache, force)
+
+                results = await asyncio.gather(*(
+                    bounded_process_series(series_url) for series_url in series_urls
+                ), return_exceptions=True)
+
+                # 單一系列的例外不影響其他系列
+                for series_url, result in zip(series_urls, results):
+                    if isinstance(result, Exception):
+                        print(f"錯誤: 處理系列 {series_url} 失敗 - {result}")
+                    else:
+                        total_success += result
+            finally:
+                await close_browser_async(browser_state)
+                save_http_cache(http_cache_path, http_cache)
 
     print("\n" + "=" * 60)
     print(f"完成！成功儲存 {total_success} 篇文章")
@@ -653,5 +1631,23 @@ async def main():
     print("=" * 60)
 
 
+def run_async(main_coro) -> None:
+    """
+    執行 async 主程式，有安裝 uvloop 時使用 uvloop 的 event loop
+
+    Args:
+        main_coro: 要執行的 coroutine
+    """
+    if uvloop is not None:
+        uvloop.run(main_coro)
+    else:
+        asyncio.run(main_coro)
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="RSS 文章抓取並轉換為 Markdown")
+    parser.add_argument(
+        "--force", action="store_true",
+        help="忽略 .http_cache.json，重新抓取並覆寫已存在的文章")
+    args = parser.parse_args()
+    run_async(main(force=args.force))
@@ -5,8 +5,7 @@
 下載圖片到 media 目錄並更新文章中的圖片路徑
 """
 
-import asyncio
-from crawl_from_rss import process_images_main
+from crawl_from_rss import process_images_main, run_async
 
 if __name__ == "__main__":
-    asyncio.run(process_images_main())
+    run_async(process_images_main())
@@ -0,0 +1,24 @@
+from crawl_from_rss import convert_article_page_to_markdown
+
+
+def test_convert_article_page_converts_first_matching_selector():
+    page = (
+        '<html><body><div class="qa-markdown"><p>ignored</p></div>'
+        '<div class="markdown-body"><h2>Hi</h2><p>a <b>b</b></p><script>x()</script></div>'
+        "</body></html>"
+    )
+
+    assert convert_article_page_to_markdown(page) == "## Hi\n\na **b**"
+
+
+def test_convert_article_page_returns_none_when_content_needs_browser():
+    # 回傳 None 時會改用瀏覽器抓取由 JavaScript 產生的內容
+    pages = [
+        "<html><body><p>no content container</p></body></html>",
+        '<div class="markdown-body"></div>',
+        '<div class="markdown-body">\n  </div>',
+        '<div class="markdown-body"><div id="app"></div></div>',
+    ]
+
+    for page in pages:
+        assert convert_article_page_to_markdown(page) is None, page
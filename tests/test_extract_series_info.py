@@ -0,0 +1,35 @@
+from crawl_from_rss import extract_series_info, sanitize_filename
+
+
+def test_extract_series_info_reads_rss_link_and_title():
+    page = (
+        '<h3 class="qa-list__title">Foo 系列</h3>'
+        '<a class="btn-rss btn-no-border" href="/rss/series/123">RSS</a>'
+    )
+
+    assert extract_series_info(page) == {
+        "rss_url": "https://ithelp.ithome.com.tw/rss/series/123",
+        "series_title": "Foo",
+    }
+
+
+def test_extract_series_info_collapses_whitespace_like_inner_text():
+    page = (
+        '<h3 class="qa-list__title">\n      30 天學會\n      <span>爬蟲</span>  系列\n    </h3>'
+        '<a href="/rss/series/9">RSS</a>'
+    )
+
+    series_title = extract_series_info(page)["series_title"]
+
+    assert series_title == "30 天學會 爬蟲"
+    assert sanitize_filename(series_title) == "30 天學會 爬蟲"
+
+
+def test_extract_series_info_treats_br_as_line_break():
+    page = '<h3 class="qa-list__title">Part 1 <br>\n Part 2</h3><a href="/rss/series/9">RSS</a>'
+
+    assert extract_series_info(page)["series_title"] == "Part 1\nPart 2"
+
+
+def test_extract_series_info_returns_none_without_rss_link():
+    assert extract_series_info("<h1>No feed</h1>") is None
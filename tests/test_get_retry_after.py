@@ -0,0 +1,36 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+
+from crawl_from_rss import MAX_RETRY_AFTER, get_retry_after
+
+
+def response_with_retry_after(value: str) -> httpx.Response:
+    return httpx.Response(429, headers={"Retry-After": value})
+
+
+def test_get_retry_after_accepts_seconds():
+    assert get_retry_after(response_with_retry_after("3")) == 3.0
+
+
+def test_get_retry_after_caps_long_delays():
+    assert get_retry_after(response_with_retry_after("3600")) == MAX_RETRY_AFTER
+
+
+def test_get_retry_after_accepts_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    delay = get_retry_after(response_with_retry_after(format_datetime(retry_at, usegmt=True)))
+    assert 0 < delay <= 30
+
+
+def test_get_retry_after_treats_minus_zero_zone_as_utc():
+    # -0000 時區會被解析成不含時區的 datetime
+    assert get_retry_after(response_with_retry_after("Wed, 21 Oct 2015 07:28:00 -0000")) == 0.0
+
+
+def test_get_retry_after_rejects_invalid_values():
+    assert get_retry_after(httpx.Response(429)) is None
+    assert get_retry_after(response_with_retry_after("nan")) is None
+    assert get_retry_after(response_with_retry_after("soon")) is None
+    assert get_retry_after(response_with_retry_after("Wed, 21 Oct 99999 07:28:00 GMT")) is None
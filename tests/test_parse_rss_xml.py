@@ -0,0 +1,61 @@
+import xml.etree.ElementTree as ET
+
+import crawl_from_rss
+from crawl_from_rss import parse_rss_xml
+
+
+def build_feed(item_count: int) -> bytes:
+    items = "".join(
+        f"<item><title>Day {i}</title>"
+        f"<link>https://ithelp.ithome.com.tw/articles/{i}?sc=rss</link>"
+        f"<description>{'內容' * 100}</description></item>"
+        for i in range(item_count)
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        "<rss><channel><title>系列 :: 2025 iThome 鐵人賽</title>"
+        f"{items}</channel></rss>"
+    ).encode("utf-8")
+
+
+def test_parse_rss_xml_returns_items_in_order():
+    series_title, articles = parse_rss_xml(build_feed(3))
+
+    assert series_title == "系列"
+    assert articles == [
+        {"title": f"Day {i}", "link": f"https://ithelp.ithome.com.tw/articles/{i}"}
+        for i in range(3)
+    ]
+
+
+def test_parse_rss_xml_detaches_every_parsed_item(monkeypatch):
+    channels = []
+    iterparse = ET.iterparse
+
+    def recording_iterparse(source, events=None):
+        for event, elem in iterparse(source, events=events):
+            if elem.tag == "channel" and not channels:
+                channels.append(elem)
+            yield event, elem
+
+    monkeypatch.setattr(crawl_from_rss.ET, "iterparse", recording_iterparse)
+
+    # 資料量要超過 iterparse 一次讀入的大小，才會有多個 item 同時接在 channel 上
+    _, articles = parse_rss_xml(build_feed(200))
+
+    assert len(articles) == 200
+    assert [child.tag for child in channels[0]] == ["title"]
+
+
+def test_parse_rss_xml_uses_untitled_for_missing_or_empty_titles():
+    feed = (
+        "<rss><channel><title></title>"
+        "<item><link>https://ithelp.ithome.com.tw/articles/1</link></item>"
+        "<item><title></title><link>https://ithelp.ithome.com.tw/articles/2</link></item>"
+        "</channel></rss>"
+    ).encode("utf-8")
+
+    series_title, articles = parse_rss_xml(feed)
+
+    assert series_title == ""
+    assert [article["title"] for article in articles] == ["Untitled", "Untitled"]